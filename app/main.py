@@ -3,22 +3,53 @@ app/main.py - Main Streamlit application entry point
 """
 
 import os
+import pyarrow as pa
 import streamlit as st
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add parent directory to path for imports (once, not on every rerun)
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from modules.llm_router import LLMRouter
-from modules.scraper import BankDataReader
+from modules.scraper import BankDataReader, SCRAPER_CONCURRENCY
 from modules.normalizer import DataNormalizer
 from modules.comparator import ProductComparator
-from modules.llm_comparator import LLMComparator
+from modules.llm_comparator import LLMComparator, INSIGHTS_FAILED
 from modules.multi_bank_comparator import MultiBankComparator  # NEW
 from modules.trends_analyzer import TrendsAnalyzer
-from modules.report_generator import ReportGenerator
-from modules.utils import load_json_config
+
+COMPETITOR_BANKS = ["ВТБ", "Альфа", "Тинькофф", "Газпромбанк", "Локобанк", "МТС Банк", "Райффайзенбанк"]
+
+# Trends mode offers a narrower bank and product selection
+TRENDS_BANKS = [b for b in COMPETITOR_BANKS if b != "Тинькофф"]
+TRENDS_PRODUCT_TYPES = ["credit_card", "deposit", "consumer_loan"]
+
+PRODUCT_LABELS = {
+    "credit_card": "Кредитная карта",
+    "debit_card": "Дебетовая карта",
+    "deposit": "Вклад",
+    "consumer_loan": "Потребительский кредит"
+}
+
+PERIOD_LABELS = {
+    "last_3_months": "Последние 3 месяца",
+    "last_6_months": "Последние 6 месяцев",
+    "last_year": "Последний год"
+}
+
+# Normalizer method per product type (debit cards reuse the deposit schema)
+NORMALIZER_ATTRS = {
+    "credit_card": "normalize_credit_card",
+    "debit_card": "normalize_deposit",
+    "deposit": "normalize_deposit",
+    "consumer_loan": "normalize_consumer_loan",
+}
 
 # Configure page
 st.set_page_config(
@@ -28,17 +59,129 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state
-if 'router' not in st.session_state:
-    st.session_state.router = LLMRouter()
-    st.session_state.scraper = BankDataReader()
-    st.session_state.normalizer = DataNormalizer()
-    st.session_state.comparator = ProductComparator()
-    st.session_state.llm_comparator = LLMComparator()
-    st.session_state.multi_comparator = MultiBankComparator(st.session_state.llm_comparator)  # NEW
-    st.session_state.trends_analyzer = TrendsAnalyzer()
-    st.session_state.report_gen = ReportGenerator()
-    st.session_state.sber_products = load_json_config("configs/sber_products.json")
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _get_product_data(bank: str, product_type: str):
+    """Cached product data lookup, keyed on (bank, product_type)"""
+    return S.scraper.get_product_data(bank, product_type)
+
+
+def _fetch_product_data(banks: list, product_type: str) -> dict:
+    """Fetch product data for several banks concurrently, keyed by bank"""
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(
+        max_workers=min(SCRAPER_CONCURRENCY, len(banks)),
+        initializer=lambda: add_script_run_ctx(ctx=ctx)
+    ) as executor:
+        return dict(zip(banks, executor.map(
+            lambda b: _get_product_data(b, product_type),
+            banks
+        )))
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def _sber_card(product_type: str):
+    """Sber baseline card for a product type, shared by all modes and sessions"""
+    cards = S.scraper.get_product_data("Сбер", product_type).get('карты')
+    return cards[0] if cards else None
+
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_sber_baselines():
+    """Warm the Sber baseline cache for every product type once per process"""
+    for product_type in PRODUCT_LABELS:
+        _sber_card(product_type)
+
+
+class _DegradedResult(Exception):
+    """Carries a fallback comparison out of a cached wrapper so it is not memoized"""
+
+    def __init__(self, result: dict):
+        super().__init__("degraded comparison result")
+        self.result = result
+
+
+def _raise_if_degraded(result: dict) -> dict:
+    """Reject non-LLM fallbacks and failed insights (st.cache_data never caches exceptions)"""
+    if not result.get("llm_powered") or result.get("insights") == INSIGHTS_FAILED:
+        raise _DegradedResult(result)
+    return result
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_llm_compare(sber_card: dict, competitor_card: dict, product_type: str, bank: str):
+    """Cached LLM comparison, keyed on the card contents"""
+    return _raise_if_degraded(S.llm_comparator.compare_products(
+        sber_card, competitor_card, product_type, bank
+    ))
+
+
+def _llm_compare(sber_card: dict, competitor_card: dict, product_type: str, bank: str):
+    """LLM comparison; only successful results are cached"""
+    try:
+        return _cached_llm_compare(sber_card, competitor_card, product_type, bank)
+    except _DegradedResult as e:
+        return e.result
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_multi_compare(sber_card: dict, competitor_cards: list, bank_names: list, product_type: str):
+    """Cached multi-bank comparison, keyed on the card contents"""
+    return _raise_if_degraded(S.multi_comparator.compare_multiple_banks(
+        sber_card, competitor_cards, bank_names, product_type
+    ))
+
+
+def _multi_compare(sber_card: dict, competitor_cards: list, bank_names: list, product_type: str):
+    """Multi-bank comparison; only successful results are cached"""
+    try:
+        return _cached_multi_compare(sber_card, competitor_cards, bank_names, product_type)
+    except _DegradedResult as e:
+        return e.result
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def _analyze_trends(bank: str, product_type: str, period: str):
+    """Cached trends payload, keyed on the Trends mode selection"""
+    return S.trends_analyzer.analyze_trends(bank, product_type, period)
+
+
+@st.cache_resource(show_spinner=False)
+def _background_pool() -> ThreadPoolExecutor:
+    """Single worker for cache warm-ups that must not block the script run"""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+
+
+def _prefetch_trends(bank: str, product_type: str):
+    """Warm the default Trends mode selection for a bank in the background"""
+    if bank in TRENDS_BANKS and product_type in TRENDS_PRODUCT_TYPES:
+        _background_pool().submit(_analyze_trends, bank, product_type, "last_3_months")
+
+
+@st.cache_resource(show_spinner=False)
+def _singletons() -> SimpleNamespace:
+    """Stateless services, shared by all sessions of the server process"""
+    llm_comparator = LLMComparator()
+    return SimpleNamespace(
+        router=LLMRouter(),
+        scraper=BankDataReader(),
+        normalizer=DataNormalizer(),
+        comparator=ProductComparator(),
+        llm_comparator=llm_comparator,
+        multi_comparator=MultiBankComparator(llm_comparator),
+        trends_analyzer=TrendsAnalyzer(),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _report_gen():
+    """Report generator, imported (with openpyxl) only once results are exported"""
+    from modules.report_generator import ReportGenerator
+    return ReportGenerator()
+
+
+S = _singletons()
+_prefetch_sber_baselines()
 
 # Title
 st.title("🏬 Banking Product Analyzer MVP")
@@ -48,9 +191,9 @@ st.markdown("*Анализ конкурентных банковских про
 st.sidebar.markdown("## ⚙️ Настройки")
 
 # LLM Status indicator
-if st.session_state.llm_comparator.is_enabled():
+if S.llm_comparator.is_enabled():
     st.sidebar.success("✅ LLM-сравнение активно")
-    st.sidebar.caption(f"🤖 Модель: {st.session_state.llm_comparator.model}")
+    st.sidebar.caption(f"🤖 Модель: {S.llm_comparator.model}")
 else:
     st.sidebar.warning("⚠️ LLM недоступен")
     st.sidebar.caption("🔑 Добавьте OPENAI_API_KEY")
@@ -70,19 +213,14 @@ if "Urgent" in mode:
     with col1:
         bank = st.selectbox(
             "Выберите банк конкурента",
-            ["ВТБ", "Альфа", "Тинькофф", "Газпромбанк", "Локобанк", "МТС Банк", "Райффайзенбанк"]
+            COMPETITOR_BANKS
         )
     
     with col2:
         product_type = st.selectbox(
             "Тип продукта",
-            ["credit_card", "debit_card", "deposit", "consumer_loan"],
-            format_func=lambda x: {
-                "credit_card": "Кредитная карта",
-                "debit_card": "Дебетовая карта",
-                "deposit": "Вклад",
-                "consumer_loan": "Потребительский кредит"
-            }[x]
+            list(PRODUCT_LABELS),
+            format_func=PRODUCT_LABELS.get
         )
     
     with col3:
@@ -92,26 +230,25 @@ if "Urgent" in mode:
     
     if analyze_btn:
         with st.spinner("Собираю данные..."): # Get competitor data from local files
-            competitor_data = st.session_state.scraper.get_product_data(bank, product_type)
+            competitor_data = _get_product_data(bank, product_type)
             
-            # Get Sber reference data from local files
-            sber_data = st.session_state.scraper.get_product_data("Сбер", product_type)
+            # Get Sber baseline card (prefetched at app start)
+            sber_card = _sber_card(product_type)
 
             # Check if data was loaded successfully
-            if not competitor_data.get('карты') or not sber_data.get('карты'):
+            if not competitor_data.get('карты') or sber_card is None:
                 st.error("Не удалось загрузить данные для сравнения. Проверьте файлы данных.")
                 st.stop()
 
-            # Extract first card from each dataset (raw data)
+            # Extract first card from the competitor dataset (raw data)
             competitor_card = competitor_data['карты'][0]
-            sber_card = sber_data['карты'][0]
             
             # NEW: Try LLM-powered comparison first
-            use_llm = st.session_state.llm_comparator.is_enabled()
+            use_llm = S.llm_comparator.is_enabled()
             
             if use_llm:
                 with st.spinner("🤖 LLM анализирует данные..."):
-                    comparison = st.session_state.llm_comparator.compare_products(
+                    comparison = _llm_compare(
                         sber_card,
                         competitor_card,
                         product_type,
@@ -120,12 +257,7 @@ if "Urgent" in mode:
             else:
                 # Fallback to legacy normalized comparison
                 with st.spinner("Анализирую данные..."): # Select the correct normalization function based on product type
-                    normalizer_func = {
-                        "credit_card": st.session_state.normalizer.normalize_credit_card,
-                        "debit_card": st.session_state.normalizer.normalize_deposit,  # Reuse deposit
-                        "deposit": st.session_state.normalizer.normalize_deposit,
-                        "consumer_loan": st.session_state.normalizer.normalize_consumer_loan,
-                    }.get(product_type)
+                    normalizer_func = getattr(S.normalizer, NORMALIZER_ATTRS.get(product_type, ""), None)
                     
                     if not normalizer_func:
                         st.error(f"Неподдерживаемый тип продукта: {product_type}")
@@ -136,7 +268,7 @@ if "Urgent" in mode:
                     sber_normalized = normalizer_func(sber_card, "Сбер")
                     
                     # Compare
-                    comparison = st.session_state.comparator.compare_products(
+                    comparison = S.comparator.compare_products(
                         sber_normalized, competitor_normalized, product_type
                     )
             
@@ -154,34 +286,36 @@ if "Urgent" in mode:
             st.dataframe(comparison["comparison_table"], use_container_width=True)
             
             st.markdown("### 💡 Ключевые выводы")
-            for insight in comparison["insights"]:
-                st.write(insight)
+            st.markdown("\n\n".join(map(str, comparison["insights"])))
             
             col_adv1, col_adv2 = st.columns(2)
             
             with col_adv1:
                 st.markdown("### ✅ Преимущества Сбера")
-                for adv in comparison["sber_advantages"]:
-                    st.write(adv)
+                st.markdown("\n\n".join(map(str, comparison["sber_advantages"])))
             
             with col_adv2:
                 st.markdown(f"### ⚡ Преимущества {bank}")
-                for adv in comparison["competitor_advantages"]:
-                    st.write(adv)
+                st.markdown("\n\n".join(map(str, comparison["competitor_advantages"])))
             
             st.markdown("### 🎯 Рекомендация")
             st.info(comparison["recommendation"])
             
             # Export button
             st.markdown("---")
-            xlsx_file = st.session_state.report_gen.generate_xlsx_comparison(comparison)
+            # Workbook is built only when the button is clicked (on a separate thread)
+            report_gen = _report_gen()
             st.download_button(
                 label="📥 Скачать XLSX отчет",
-                data=xlsx_file,
-                file_name=st.session_state.report_gen.get_filename("urgent", bank),
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                data=lambda: report_gen.generate_xlsx_comparison(comparison),
+                file_name=report_gen.get_filename("urgent", bank),
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                on_click="ignore"
             )
 
+            # Trends mode is the usual next step for the same bank
+            _prefetch_trends(bank, product_type)
+
 elif "Мульти-банк" in mode:
     st.markdown("### Мульти-банк сравнение - Сбер vs. Конкуренты")
     st.markdown("Сравните продукт Сбербанка с несколькими конкурентами одновременно")
@@ -189,23 +323,16 @@ elif "Мульти-банк" in mode:
     # Product type selection
     product_type = st.selectbox(
         "Тип продукта",
-        ["credit_card", "debit_card", "deposit", "consumer_loan"],
-        format_func=lambda x: {
-            "credit_card": "Кредитная карта",
-            "debit_card": "Дебетовая карта",
-            "deposit": "Вклад",
-            "consumer_loan": "Потребительский кредит"
-        }[x],
+        list(PRODUCT_LABELS),
+        format_func=PRODUCT_LABELS.get,
         key="multi_product_type"
     )
     
     # Multi-select for banks
     st.markdown("#### Выберите банки для сравнения")
-    available_banks = ["ВТБ", "Альфа", "Тинькофф", "Газпромбанк", "Локобанк", "МТС Банк", "Райффайзенбанк"]
-    
     selected_banks = st.multiselect(
         "Конкуренты (можно выбрать несколько)",
-        available_banks,
+        COMPETITOR_BANKS,
         default=["ВТБ", "Альфа"],
         help="Выберите от 1 до 7 банков для сравнения с Сбербанком"
     )
@@ -219,21 +346,21 @@ elif "Мульти-банк" in mode:
             st.stop()
         
         with st.spinner("Собираю данные по всем банкам..."):
-            # Get Sber reference data
-            sber_data = st.session_state.scraper.get_product_data("Сбер", product_type)
+            # Fetch all selected competitors in one concurrent batch
+            fetched = _fetch_product_data(selected_banks, product_type)
+            
+            # Get Sber baseline card (prefetched at app start)
+            sber_card = _sber_card(product_type)
             
-            if not sber_data.get('карты'):
+            if sber_card is None:
                 st.error("Не удалось загрузить данные Сбербанка")
                 st.stop()
             
-            sber_card = sber_data['карты'][0]
-            
-            # Get competitor data for all selected banks
             competitor_data_list = []
             valid_banks = []
             
             for bank in selected_banks:
-                bank_data = st.session_state.scraper.get_product_data(bank, product_type)
+                bank_data = fetched[bank]
                 if bank_data.get('карты'):
                     competitor_data_list.append(bank_data['карты'][0])
                     valid_banks.append(bank)
@@ -246,7 +373,7 @@ elif "Мульти-банк" in mode:
             
             # Perform multi-bank comparison
             with st.spinner("🤖 LLM анализирует все банки..."):
-                comparison = st.session_state.multi_comparator.compare_multiple_banks(
+                comparison = _multi_compare(
                     sber_card,
                     competitor_data_list,
                     valid_banks,
@@ -270,13 +397,11 @@ elif "Мульти-банк" in mode:
             
             # Display insights
             st.markdown("### 💡 Ключевые выводы")
-            for insight in comparison["insights"]:
-                st.markdown(insight)
+            st.markdown("\n\n".join(map(str, comparison["insights"])))
             
             # Display Sber advantages
             st.markdown("### ✅ Преимущества Сбербанка")
-            for adv in comparison["sber_advantages"]:
-                st.markdown(adv)
+            st.markdown("\n\n".join(map(str, comparison["sber_advantages"])))
             
             # Display competitor highlights
             st.markdown("### ⚡ Сильные стороны конкурентов")
@@ -289,8 +414,7 @@ elif "Мульти-банк" in mode:
                     with cols[i]:
                         st.markdown(f"**{bank}**")
                         highlights = competitor_highlights.get(bank, [])
-                        for highlight in highlights:
-                            st.markdown(highlight)
+                        st.markdown("\n\n".join(map(str, highlights)))
             
             # Display recommendation
             st.markdown("### 🎯 Общая рекомендация")
@@ -310,18 +434,14 @@ else:  # Trends mode
     with col1:
         bank = st.selectbox(
             "Выберите банк",
-            ["ВТБ", "Альфа", "Газпромбанк", "Локобанк", "МТС Банк", "Райффайзенбанк"]
+            TRENDS_BANKS
         )
     
     with col2:
         product_type = st.selectbox(
             "Тип продукта",
-            ["credit_card", "deposit", "consumer_loan"],
-            format_func=lambda x: {
-                "credit_card": "Кредитная карта",
-                "deposit": "Вклад",
-                "consumer_loan": "Потребительский кредит"
-            }[x],
+            TRENDS_PRODUCT_TYPES,
+            format_func=PRODUCT_LABELS.get,
             key="trends_product"
         )
     
@@ -329,20 +449,14 @@ else:  # Trends mode
         period = st.selectbox(
             "Временной период",
             ["last_3_months", "last_6_months", "last_year"],
-            format_func=lambda x: {
-                "last_3_months": "Последние 3 месяца",
-                "last_6_months": "Последние 6 месяцев",
-                "last_year": "Последний год"
-            }[x]
+            format_func=PERIOD_LABELS.get
         )
     
     analyze_btn = st.button("📊 Анализировать тренды", use_container_width=True)
     
     if analyze_btn:
         with st.spinner("Анализирую тренды..."):
-            trends = st.session_state.trends_analyzer.analyze_trends(
-                bank, product_type, period
-            )
+            trends = _analyze_trends(bank, product_type, period)
             
             st.markdown("---")
             st.markdown("## Результаты анализа трендов")
@@ -354,18 +468,19 @@ else:  # Trends mode
             # Display timeline table
             if trends.get("timeline"):
                 st.markdown("### 📅 Таблица изменений")
-                import pandas as pd
-                timeline_df = pd.DataFrame(trends["timeline"])
-                st.dataframe(timeline_df, use_container_width=True)
+                # Typed Arrow table: st.dataframe serializes it without a pandas round-trip
+                st.dataframe(pa.Table.from_pydict(trends["timeline_columns"]), use_container_width=True)
             
             # Export button
             st.markdown("---")
-            xlsx_file = st.session_state.report_gen.generate_xlsx_trends(trends)
+            # Workbook is built only when the button is clicked (on a separate thread)
+            report_gen = _report_gen()
             st.download_button(
                 label="📥 Скачать XLSX отчет",
-                data=xlsx_file,
-                file_name=st.session_state.report_gen.get_filename("trends", bank, product_type),
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                data=lambda: report_gen.generate_xlsx_trends(trends),
+                file_name=report_gen.get_filename("trends", bank, product_type),
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                on_click="ignore"
             )
 
 # Footer
@@ -1,6 +1,8 @@
 # Data sources configuration with URLs and CSS selectors
 
-DATA_SOURCES = {
+from configs.frozen import freeze
+
+DATA_SOURCES = freeze({
     "credit_card": {
         "vtb": {
             "url": "https://www.vtb.ru/personal/karty/kreditnye/",
@@ -115,7 +117,7 @@ DATA_SOURCES = {
         "sravni_ru": "https://sravni.ru/novosti/",
         "kommersant_fin": "https://www.kommersant.ru/rubric/37"
     }
-}
+})
 
 SEARCH_PATTERNS = {
     "rate_history": "История изменения ставок по {product} {bank}",
@@ -128,4 +130,4 @@ TIME_FILTERS = {
     "last_3_months": "-92 days",
     "last_6_months": "-180 days",
     "last_year": "-365 days"
-}
\ No newline at end of file
+}
@@ -5,13 +5,17 @@ This module provides mappings between different data source field names
 and the normalized schema fields used internally.
 """
 
-from typing import Dict, List, Any
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, Mapping
+
+from configs.frozen import freeze
 
 # ============================================================================
 # FIELD MAPPINGS: Source field names → Normalized field names
 # ============================================================================
 
-CREDIT_CARD_FIELD_MAPPING = {
+CREDIT_CARD_FIELD_MAPPING = freeze({
     # Standard fields from individual bank files
     "название": "product_name",
     "ставка": "interest_rate",
@@ -26,9 +30,9 @@ CREDIT_CARD_FIELD_MAPPING = {
     "кредитный_лимит": "max_limit",
     "стоимость_обслуживания": "annual_fee",
     "первоначальный_взнос": "initial_payment",
-}
+})
 
-DEBIT_CARD_FIELD_MAPPING = {
+DEBIT_CARD_FIELD_MAPPING = freeze({
     # Standard fields
     "название": "product_name",
     "стоимость": "annual_fee",
@@ -48,9 +52,9 @@ DEBIT_CARD_FIELD_MAPPING = {
     "снятие_наличных_чужие_банки": "cash_withdrawal_other_banks",
     "переводы_по_реквизитам": "transfers_by_details",
     "процент_на_остаток": "interest_on_balance",
-}
+})
 
-DEPOSIT_FIELD_MAPPING = {
+DEPOSIT_FIELD_MAPPING = freeze({
     "название": "product_name",
     "ставка": "interest_rate",
     "срок": "term_months",
@@ -59,9 +63,9 @@ DEPOSIT_FIELD_MAPPING = {
     "пополнение": "replenishment",
     "досрочное_снятие": "early_withdrawal",
     "страхование": "insurance",
-}
+})
 
-CONSUMER_LOAN_FIELD_MAPPING = {
+CONSUMER_LOAN_FIELD_MAPPING = freeze({
     "название": "product_name",
     "ставка": "interest_rate",
     "сумма": "max_amount",
@@ -69,7 +73,7 @@ CONSUMER_LOAN_FIELD_MAPPING = {
     "срок": "term_months",
     "комиссия": "commission",
     "время_одобрения": "approval_time",
-}
+})
 
 # ============================================================================
 # NESTED FIELD MAPPINGS: For complex nested structures
@@ -96,21 +100,22 @@ NESTED_FIELD_HANDLERS = {
 # PRODUCT TYPE MAPPING
 # ============================================================================
 
-PRODUCT_TYPE_MAPPINGS = {
+PRODUCT_TYPE_MAPPINGS = freeze({
     "credit_card": CREDIT_CARD_FIELD_MAPPING,
     "debit_card": DEBIT_CARD_FIELD_MAPPING,
     "deposit": DEPOSIT_FIELD_MAPPING,
     "consumer_loan": CONSUMER_LOAN_FIELD_MAPPING,
-}
+})
 
 # ============================================================================
 # REVERSE MAPPINGS: For displaying data back in original format
 # ============================================================================
 
-def get_reverse_mapping(product_type: str) -> Dict[str, str]:
-    """Get reverse mapping (normalized → original field names)"""
+@lru_cache(maxsize=None)
+def get_reverse_mapping(product_type: str) -> Mapping[str, str]:
+    """Get reverse mapping (normalized → original field names), built once per product type"""
     forward_mapping = PRODUCT_TYPE_MAPPINGS.get(product_type, {})
-    return {v: k for k, v in forward_mapping.items()}
+    return freeze({v: k for k, v in forward_mapping.items()})
 
 # ============================================================================
 # FIELD ALIASES: Alternative names for the same field
@@ -125,24 +130,33 @@ FIELD_ALIASES = {
     "cashback": ["кешбек", "кэшбэк"],
 }
 
+# ============================================================================
+# INVERSE INDEX: Normalized field → every known source field name
+# ============================================================================
+
+def _build_normalized_to_sources() -> Dict[str, FrozenSet[str]]:
+    """Collect aliases and all product mappings into one lookup table"""
+    sources = defaultdict(set)
+    for mapping in PRODUCT_TYPE_MAPPINGS.values():
+        for source, target in mapping.items():
+            sources[target].add(source)
+    for normalized_field, aliases in FIELD_ALIASES.items():
+        sources[normalized_field].update(aliases)
+    return {field: frozenset(names) for field, names in sources.items()}
+
+NORMALIZED_TO_SOURCES = _build_normalized_to_sources()
+
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def get_mapping_for_product(product_type: str) -> Dict[str, str]:
+def get_mapping_for_product(product_type: str) -> Mapping[str, str]:
     """Get field mapping for a specific product type"""
     return PRODUCT_TYPE_MAPPINGS.get(product_type, {})
 
 def get_all_possible_field_names(normalized_field: str) -> List[str]:
     """Get all possible source field names for a normalized field"""
-    aliases = FIELD_ALIASES.get(normalized_field, [])
-    # Add reverse lookups from all product mappings
-    all_names = set(aliases)
-    for mapping in PRODUCT_TYPE_MAPPINGS.values():
-        for source, target in mapping.items():
-            if target == normalized_field:
-                all_names.add(source)
-    return list(all_names)
+    return list(NORMALIZED_TO_SOURCES.get(normalized_field, ()))
 
 def normalize_field_name(source_field: str, product_type: str) -> str:
     """Convert source field name to normalized field name"""
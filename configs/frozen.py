@@ -0,0 +1,15 @@
+"""
+frozen.py - Read-only views for module-level config tables
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into MappingProxyType and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
@@ -2,7 +2,11 @@
 schemas.py - Fixed comparison schemas for different product types
 """
 
-CREDIT_CARD_SCHEMA = {
+from typing import Any, Mapping
+
+from configs.frozen import freeze
+
+CREDIT_CARD_SCHEMA = freeze({
     "type": "credit_card",
     "fields": [
         "bank",
@@ -26,9 +30,9 @@ CREDIT_CARD_SCHEMA = {
         "max_limit": "Макс. лимит",
         "commission": "Комиссия"
     }
-}
+})
 
-DEPOSIT_SCHEMA = {
+DEPOSIT_SCHEMA = freeze({
     "type": "deposit",
     "fields": [
         "bank",
@@ -52,9 +56,9 @@ DEPOSIT_SCHEMA = {
         "early_withdrawal": "Ранний вывод",
         "insurance": "Страховка"
     }
-}
+})
 
-CONSUMER_LOAN_SCHEMA = {
+CONSUMER_LOAN_SCHEMA = freeze({
     "type": "consumer_loan",
     "fields": [
         "bank",
@@ -76,14 +80,14 @@ CONSUMER_LOAN_SCHEMA = {
         "approval_time": "Время одобрения",
         "min_score": "Мин. score"
     }
-}
+})
 
-SCHEMAS = {
+SCHEMAS = freeze({
     "credit_card": CREDIT_CARD_SCHEMA,
     "deposit": DEPOSIT_SCHEMA,
     "consumer_loan": CONSUMER_LOAN_SCHEMA
-}
+})
 
-def get_schema(product_type: str):
+def get_schema(product_type: str) -> Mapping[str, Any]:
     """Get schema for product type"""
-    return SCHEMAS.get(product_type, CREDIT_CARD_SCHEMA)
+    return SCHEMAS.get(product_type, SCHEMAS["credit_card"])
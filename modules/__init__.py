@@ -1,22 +1,29 @@
 """
 Modules package initialization
+
+Exports are resolved lazily, so importing one submodule (e.g. modules.scraper)
+does not pull in openpyxl, pandas or openai through its siblings.
 """
 
-from .llm_router import LLMRouter
-from .scraper import BankDataReader
-from .normalizer import DataNormalizer
-from .comparator import ProductComparator
-from .trends_analyzer import TrendsAnalyzer
-from .report_generator import ReportGenerator
-from .utils import load_json_config, save_json_cache
+import importlib
+
+_EXPORTS = {
+    'LLMRouter': '.llm_router',
+    'BankDataReader': '.scraper',
+    'DataNormalizer': '.normalizer',
+    'ProductComparator': '.comparator',
+    'TrendsAnalyzer': '.trends_analyzer',
+    'ReportGenerator': '.report_generator',
+    'load_json_config': '.utils',
+    'save_json_cache': '.utils'
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'LLMRouter',
-    'BankDataReader',
-    'DataNormalizer',
-    'ProductComparator',
-    'TrendsAnalyzer',
-    'ReportGenerator',
-    'load_json_config',
-    'save_json_cache'
-]
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -3,11 +3,26 @@ modules/comparator.py - Comparison and insights generation
 """
 
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
-import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+
+@lru_cache(maxsize=256)
+def _parse_rate(rate_str: str) -> Optional[float]:
+    """Parse a rate string to float; cached because each value is compared several times"""
+    try:
+        # If it's a range like "17.9% - 25.9%", take the first number
+        if '-' in rate_str:
+            rate_str = rate_str.split('-')[0]
+        
+        return float(rate_str.replace('%', '').replace('₽', '').strip())
+    except ValueError:
+        logger.warning(f"Could not extract rate from '{rate_str}'")
+        return None
+
+
 class ProductComparator:
     """Compare products and generate insights"""
     
@@ -16,7 +31,8 @@ class ProductComparator:
                         product_type: str) -> Dict[str, Any]:
         """Generate comparison report"""
         
-        # Create comparison dataframe
+        # Create comparison dataframe (pandas is imported on first comparison)
+        import pandas as pd
         comparison_df = pd.DataFrame({
             "Параметр": list(sber_data.keys()),
             "Сбер": list(sber_data.values()),
@@ -73,15 +89,7 @@ class ProductComparator:
         """Extract numeric rate from string, handles ranges."""
         if not rate_str or rate_str == "Н/Д":
             return None
-        try:
-            # If it's a range like "17.9% - 25.9%", take the first number
-            if '-' in str(rate_str):
-                rate_str = str(rate_str).split('-')[0]
-            
-            return float(str(rate_str).replace('%', '').replace('₽', '').strip())
-        except (ValueError, TypeError):
-            logger.warning(f"Could not extract rate from '{rate_str}'")
-            return None
+        return _parse_rate(str(rate_str))
 
     def _find_advantages(self, first: Dict, second: Dict, product_type: str) -> List[str]:
         """Find competitive advantages of first vs second"""
@@ -96,16 +104,17 @@ class ProductComparator:
             if product_type == "deposit" and rate1 > rate2:
                 advantages.append(f"• Более высокая процентная ставка: {first.get('interest_rate')}")
 
-        # Annual fee comparison (lower is better)
+        # Annual fee comparison (lower is better; missing fees are skipped before parsing)
         fee1_str = str(first.get("annual_fee", "Н/Д")).replace('₽', '')
         fee2_str = str(second.get("annual_fee", "Н/Д")).replace('₽', '')
-        try:
-            fee1 = float(fee1_str)
-            fee2 = float(fee2_str)
-            if fee1 < fee2:
-                advantages.append(f"• Более низкая стоимость обслуживания: {first.get('annual_fee')}")
-        except (ValueError, TypeError):
-            pass # Cannot compare fees if they are not numeric
+        if "Н/Д" not in (fee1_str, fee2_str):
+            try:
+                fee1 = float(fee1_str)
+                fee2 = float(fee2_str)
+                if fee1 < fee2:
+                    advantages.append(f"• Более низкая стоимость обслуживания: {first.get('annual_fee')}")
+            except (ValueError, TypeError):
+                pass # Cannot compare fees if they are not numeric
 
         return advantages if advantages else ["Преимущества не найдены"]
 
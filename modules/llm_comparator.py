@@ -6,18 +6,42 @@ rather than relying on hardcoded field mappings.
 """
 import os
 import json
+import hashlib
+import importlib.util
 import logging
-from typing import Dict, Any, List, Optional
-import pandas as pd
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv, find_dotenv
 
+from modules.utils import load_json_config, save_json_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 project_root = Path(__file__).parent.absolute()
 env_path = project_root / '.env'
 load_dotenv(dotenv_path=env_path, override=True)
 
 logger = logging.getLogger(__name__)
 
+INSIGHTS_FAILED = ["⚠️ Не удалось сгенерировать выводы"]
+
+# Response cache: bump the version whenever the prompts or the response schema change
+LLM_CACHE_VERSION = 2
+LLM_CACHE_TTL = 24 * 3600
+LLM_CACHE_MAX_ENTRIES = 256
+
+# Product type names as used inside LLM prompts
+PRODUCT_TYPE_RU = {
+    "credit_card": "кредитная карта",
+    "debit_card": "дебетовая карта",
+    "deposit": "вклад",
+    "consumer_loan": "потребительский кредит",
+}
+
 class LLMComparator:
     """LLM-powered product comparator that adapts to available data"""
 
@@ -35,27 +59,42 @@ class LLMComparator:
         # Set a default OpenRouter model (e.g., Gemini Flash is fast/cheap for comparisons)
         self.model = "tngtech/deepseek-r1t2-chimera:free"
 
+        self._client = None
+
+        # Exact-match cache of raw LLM responses: in memory, backed by JSON files
+        self.cache_dir = Path(__file__).parent.parent / "cache" / "llm"
+        self._response_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
         if not self.api_key:
             logger.warning("No API key found. LLM comparison will be disabled.")
             self.enabled = False
+        elif importlib.util.find_spec("openai") is None:
+            logger.error("openai package not installed. Run: pip install openai")
+            self.enabled = False
         else:
             self.enabled = True
-            try:
-                from openai import OpenAI
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    base_url=self.base_url
-                )
-                
-                if "openrouter" in self.base_url.lower():
-                    self.client.default_headers.update({
-                        "HTTP-Referer": "https://github.com/twirlz-git/Bank-Dashboard",
-                        "X-Title": "Banking Product Comparator"
-                    })
-                    
-            except ImportError:
-                logger.error("openai package not installed. Run: pip install openai")
-                self.enabled = False
+
+    @property
+    def client(self):
+        """OpenAI client, created (and openai imported) on first use."""
+        if self._client is None:
+            from openai import OpenAI
+
+            # default_headers on a built client is a fresh copy, so pass them in
+            headers = {}
+            if "openrouter" in self.base_url.lower():
+                headers = {
+                    "HTTP-Referer": "https://github.com/twirlz-git/Bank-Dashboard",
+                    "X-Title": "Banking Product Comparator"
+                }
+
+            self._client = OpenAI(
+                api_key=self.api_key,
+                base_url=self.base_url,
+                default_headers=headers
+            )
+        return self._client
 
     def compare_products(
         self,
@@ -81,15 +120,24 @@ class LLMComparator:
             return self._fallback_comparison(sber_data, competitor_data)
 
         try:
-            # Step 1: Ask LLM to extract and structure comparison data
-            comparison_structure = self._get_comparison_structure(
+            cache_key = self._response_cache_key(
                 sber_data, competitor_data, product_type, competitor_name
             )
+            cached = self._load_cached_response(cache_key)
+
+            if cached:
+                comparison_structure = cached["comparison_structure"]
+                insights = cached["insights"]
+            else:
+                # Step 1: Ask LLM to extract and structure comparison data
+                comparison_structure = self._get_comparison_structure(
+                    sber_data, competitor_data, product_type, competitor_name
+                )
 
-            # Step 2: Ask LLM to generate insights
-            insights = self._generate_llm_insights(
-                comparison_structure, product_type, competitor_name
-            )
+                # Step 2: Ask LLM to generate insights
+                insights = self._generate_llm_insights(
+                    comparison_structure, product_type, competitor_name
+                )
 
             # Step 3: Create comparison dataframe
             comparison_df = self._create_comparison_table(comparison_structure)
@@ -98,6 +146,13 @@ class LLMComparator:
             sber_advantages = comparison_structure.get("sber_advantages", [])
             competitor_advantages = comparison_structure.get("competitor_advantages", [])
 
+            # Persist only replies that produced a full, non-degraded result
+            if not cached and insights != INSIGHTS_FAILED:
+                self._store_cached_response(cache_key, {
+                    "comparison_structure": comparison_structure,
+                    "insights": insights
+                })
+
             return {
                 "comparison_table": comparison_df,
                 "insights": insights,
@@ -114,6 +169,93 @@ class LLMComparator:
             logger.error(f"LLM comparison failed: {e}")
             return self._fallback_comparison(sber_data, competitor_data)
 
+    def _response_cache_key(
+        self,
+        sber_data: Dict[str, Any],
+        competitor_data: Dict[str, Any],
+        product_type: str,
+        competitor_name: str
+    ) -> str:
+        """
+        Build a stable cache key from canonical (sorted-keys) JSON of the inputs.
+        """
+        canonical = json.dumps(
+            [LLM_CACHE_VERSION, sber_data, competitor_data, product_type, competitor_name, self.model],
+            ensure_ascii=False,
+            sort_keys=True
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _load_cached_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return cached LLM responses for the key, checking memory first, then disk.
+        Entries older than LLM_CACHE_TTL (by save time / file mtime) are dropped.
+        """
+        now = time.time()
+        with self._response_cache_lock:
+            entry = self._response_cache.get(cache_key)
+            if entry is not None:
+                if now - entry[0] < LLM_CACHE_TTL:
+                    self._response_cache.move_to_end(cache_key)
+                    return entry[1]
+                del self._response_cache[cache_key]
+
+        cache_file = self.cache_dir / f"{cache_key}.json"
+        try:
+            saved_at = cache_file.stat().st_mtime
+        except OSError:
+            return None
+        if now - saved_at >= LLM_CACHE_TTL:
+            self._discard_cache_file(cache_file)
+            return None
+
+        cached = load_json_config(str(cache_file)) or None
+        if cached:
+            self._remember_response(cache_key, saved_at, cached)
+        return cached
+
+    def _remember_response(self, cache_key: str, saved_at: float, response: Dict[str, Any]):
+        """
+        Keep a response in the in-memory LRU, evicting the oldest beyond LLM_CACHE_MAX_ENTRIES.
+        """
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = (saved_at, response)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > LLM_CACHE_MAX_ENTRIES:
+                self._response_cache.popitem(last=False)
+
+    def _store_cached_response(self, cache_key: str, response: Dict[str, Any]):
+        """
+        Remember LLM responses in memory and persist them for later runs.
+        """
+        self._remember_response(cache_key, time.time(), response)
+        try:
+            save_json_cache(response, f"{cache_key}.json", cache_dir=str(self.cache_dir))
+        except (OSError, TypeError) as e:
+            logger.warning(f"Could not persist LLM response cache: {e}")
+        self._prune_disk_cache()
+
+    def _prune_disk_cache(self):
+        """
+        Delete cache files older than LLM_CACHE_TTL (runs only after a fresh LLM call).
+        """
+        cutoff = time.time() - LLM_CACHE_TTL
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                if cache_file.stat().st_mtime < cutoff:
+                    self._discard_cache_file(cache_file)
+            except OSError:
+                continue
+
+    def _discard_cache_file(self, cache_file: Path):
+        """
+        Remove an expired cache file, ignoring files that are already gone or locked.
+        """
+        try:
+            cache_file.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not remove expired LLM cache file {cache_file}: {e}")
+
     def _get_comparison_structure(
         self,
         sber_data: Dict[str, Any],
@@ -159,12 +301,7 @@ class LLMComparator:
         """
         Build prompt for LLM to structure the comparison.
         """
-        product_type_ru = {
-            "credit_card": "кредитная карта",
-            "debit_card": "дебетовая карта",
-            "deposit": "вклад",
-            "consumer_loan": "потребительский кредит",
-        }.get(product_type, product_type)
+        product_type_ru = PRODUCT_TYPE_RU.get(product_type, product_type)
 
         return f"""Сравните два банковских продукта типа "{product_type_ru}".
 
@@ -269,12 +406,14 @@ class LLMComparator:
 
         except Exception as e:
             logger.error(f"Failed to generate insights: {e}")
-            return ["⚠️ Не удалось сгенерировать выводы"]
+            return list(INSIGHTS_FAILED)
 
-    def _create_comparison_table(self, comparison_structure: Dict[str, Any]) -> pd.DataFrame:
+    def _create_comparison_table(self, comparison_structure: Dict[str, Any]) -> "pd.DataFrame":
         """
         Create pandas DataFrame from comparison structure.
         """
+        import pandas as pd
+
         parameters = comparison_structure.get("parameters", [])
         
         if not parameters:
@@ -300,6 +439,8 @@ class LLMComparator:
         """
         Fallback to basic comparison when LLM is unavailable.
         """
+        import pandas as pd
+
         # Get all unique keys from both datasets
         all_keys = set(sber_data.keys()) | set(competitor_data.keys())
         
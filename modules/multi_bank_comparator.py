@@ -4,12 +4,17 @@ modules/multi_bank_comparator.py - Multi-bank comparison functionality
 Compares multiple competitor banks against Sberbank as a reference.
 """
 import logging
-from typing import Dict, Any, List, Optional
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
 import json
 from pathlib import Path
 from dotenv import load_dotenv
 
+from modules.llm_comparator import INSIGHTS_FAILED, PRODUCT_TYPE_RU
+from modules.utils import loads_json
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 project_root = Path(__file__).parent.absolute()
 env_path = project_root / '.env'
 load_dotenv(dotenv_path=env_path, override=True)
@@ -99,14 +104,16 @@ class MultiBankComparator:
                 temperature=0.3
             )
 
-            result = json.loads(response.choices[0].message.content)
+            result = loads_json(response.choices[0].message.content)
             logger.info(f"LLM multi-bank comparison: {len(result.get('parameters', []))} parameters found")
 
             # Create comparison table
             comparison_df = self._create_multi_bank_table(result, bank_names)
 
-            # Generate insights
-            insights = self._generate_multi_bank_insights(result, bank_names, product_type)
+            # Insights come back in the same reply; only ask again if they are missing
+            insights = result.get("insights") or self._generate_multi_bank_insights(
+                result, bank_names, product_type
+            )
 
             return {
                 "comparison_table": comparison_df,
@@ -135,12 +142,7 @@ class MultiBankComparator:
         """
         Build prompt for LLM to structure multi-bank comparison.
         """
-        product_type_ru = {
-            "credit_card": "кредитная карта",
-            "debit_card": "дебетовая карта",
-            "deposit": "вклад",
-            "consumer_loan": "потребительский кредит",
-        }.get(product_type, product_type)
+        product_type_ru = PRODUCT_TYPE_RU.get(product_type, product_type)
 
         competitors_data = ""
         for i, (bank_name, data) in enumerate(zip(bank_names, competitor_data_list), 1):
@@ -158,7 +160,8 @@ class MultiBankComparator:
 2. Для каждого параметра укажите значения для Сбера и всех конкурентов
 3. Найдите преимущества Сбербанка
 4. Найдите самые конкурентные предложения среди конкурентов
-5. Дайте общую рекомендацию
+5. Сформулируйте 4-6 ключевых выводов
+6. Дайте общую рекомендацию
 
 **Верните JSON в следующем формате:**
 {{
@@ -173,6 +176,10 @@ class MultiBankComparator:
             "best_bank": "Название банка с лучшим значением или null"
         }}
     ],
+    "insights": [
+        "✓ Первый вывод",
+        "⚠️ Второй вывод"
+    ],
     "sber_advantages": [
         "• Преимущество 1",
         "• Преимущество 2"
@@ -195,6 +202,7 @@ class MultiBankComparator:
 - Для процентных ставок: меньше = лучше для кредитов, больше = лучше для вкладов
 - Для комиссий и стоимости: меньше = лучше
 - Будьте объективны и конкретны
+- Выводы: краткие (1 строка), начинаются с ✓ (позитив) или ⚠️ (предупреждение), содержат конкретные цифры и упоминают конкретные банки
 - Форматируйте текст используя Markdown:
   - Выделяйте ключевые цифры и названия жирным шрифтом (**текст**)
   - Используйте эмодзи, где уместно
@@ -204,10 +212,12 @@ class MultiBankComparator:
         self,
         comparison_structure: Dict[str, Any],
         bank_names: List[str]
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         """
         Create pandas DataFrame from multi-bank comparison structure.
         """
+        import pandas as pd
+
         parameters = comparison_structure.get("parameters", [])
 
         if not parameters:
@@ -217,7 +227,8 @@ class MultiBankComparator:
                 **{bank: ["Н/Д"] for bank in bank_names}
             })
 
-        # Build table data
+        # Build table data column-wise, one list per bank
+        competitor_values = [p.get("competitor_values") or {} for p in parameters]
         table_data = {
             "Параметр": [p["name"] for p in parameters],
             "Сбербанк": [p["sber_value"] for p in parameters]
@@ -226,8 +237,8 @@ class MultiBankComparator:
         # Add columns for each competitor
         for bank_name in bank_names:
             table_data[bank_name] = [
-                p["competitor_values"].get(bank_name, "Н/Д")
-                for p in parameters
+                values.get(bank_name, "Н/Д")
+                for values in competitor_values
             ]
 
         df = pd.DataFrame(table_data)
@@ -283,12 +294,12 @@ class MultiBankComparator:
                 temperature=0.5
             )
 
-            result = json.loads(response.choices[0].message.content)
+            result = loads_json(response.choices[0].message.content)
             return result.get("insights", [])
 
         except Exception as e:
             logger.error(f"Failed to generate multi-bank insights: {e}")
-            return ["⚠️ Не удалось сгенерировать выводы"]
+            return list(INSIGHTS_FAILED)
 
     def _basic_multi_comparison(
         self,
@@ -299,23 +310,22 @@ class MultiBankComparator:
         """
         Fallback to basic multi-bank comparison when LLM is unavailable.
         """
-        # Get all unique keys from all datasets
-        all_keys = set(sber_data.keys())
-        for data in competitor_data_list:
-            all_keys.update(data.keys())
+        import pandas as pd
+
+        # Get all unique keys from all datasets (Sber's order first)
+        all_keys = list(dict.fromkeys(
+            key for data in (sber_data, *competitor_data_list) for key in data
+        ))
 
-        # Build comparison table
+        # Build comparison table column-wise
         table_data = {
-            "Параметр": list(all_keys),
+            "Параметр": all_keys,
             "Сбербанк": [sber_data.get(k, "Н/Д") for k in all_keys]
         }
 
         # Add columns for each competitor
-        for i, bank_name in enumerate(bank_names):
-            table_data[bank_name] = [
-                competitor_data_list[i].get(k, "Н/Д")
-                for k in all_keys
-            ]
+        for bank_name, data in zip(bank_names, competitor_data_list):
+            table_data[bank_name] = [data.get(k, "Н/Д") for k in all_keys]
 
         comparison_df = pd.DataFrame(table_data)
 
@@ -332,6 +342,8 @@ class MultiBankComparator:
         """
         Return empty comparison structure.
         """
+        import pandas as pd
+
         return {
             "comparison_table": pd.DataFrame({
                 "Параметр": ["Нет данных"],
@@ -3,117 +3,142 @@ modules/report_generator.py - Generate XLSX and JSON reports
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
-import pandas as pd
 from openpyxl import Workbook
-from openpyxl.cell import MergedCell
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
+from openpyxl.writer.excel import ExcelWriter
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from io import BytesIO
+from zipfile import ZipFile, ZIP_DEFLATED
 
 logger = logging.getLogger(__name__)
 
+# Reports are small and built on request, so favour speed over ratio
+XLSX_COMPRESSLEVEL = 1
+
+# Shared cell styles (openpyxl style objects are immutable, so one instance serves every cell)
+TITLE_FONT = Font(size=14, bold=True)
+SECTION_FONT = Font(size=12, bold=True)
+LABEL_FONT = Font(bold=True)
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+
 class ReportGenerator:
     """Generate XLSX and JSON format reports"""
     
     def generate_xlsx_comparison(self, comparison_data: Dict[str, Any]) -> BytesIO:
         """Generate XLSX file with comparison table"""
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Сравнение"
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Сравнение")
         
-        # Add title
-        ws['A1'] = "Сравнение банковских продуктов"
-        ws['A1'].font = Font(size=14, bold=True)
-        ws.merge_cells('A1:D1')
+        # Title and timestamp rows
+        rows = [
+            ["Сравнение банковских продуктов"],
+            [f"Дата: {datetime.now().strftime('%d.%m.%Y %H:%M')}"],
+        ]
         
-        # Add timestamp
-        ws['A2'] = f"Дата: {datetime.now().strftime('%d.%m.%Y %H:%M')}"
-        ws.merge_cells('A2:D2')
-        
-        # Add comparison table
+        # Add comparison table (header row, then values)
         comparison_df = comparison_data.get("comparison_table")
         if comparison_df is not None:
-            for r_idx, row in enumerate(comparison_df.values, start=4):
-                for c_idx, value in enumerate(row, start=1):
-                    ws.cell(row=r_idx, column=c_idx, value=value)
-            
-            # Add headers
-            headers = comparison_df.columns
-            for c_idx, header in enumerate(headers, start=1):
-                cell = ws.cell(row=3, column=c_idx, value=header)
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+            rows.append(list(comparison_df.columns))
+            rows.extend(comparison_df.values.tolist())
+        
+        self._set_column_widths(ws, rows)
+        
+        ws.append([self._styled_cell(ws, rows[0][0], font=TITLE_FONT)])
+        ws.append(rows[1])
+        if comparison_df is not None:
+            ws.append([
+                self._styled_cell(
+                    ws, header,
+                    font=HEADER_FONT,
+                    fill=HEADER_FILL
+                )
+                for header in rows[2]
+            ])
+            for row in rows[3:]:
+                ws.append(row)
+        
+        ws.merged_cells.add('A1:D1')
+        ws.merged_cells.add('A2:D2')
         
         # Add insights sheet
         insights_ws = wb.create_sheet("Анализ")
-        insights_ws['A1'] = "Ключевые выводы"
-        insights_ws['A1'].font = Font(size=12, bold=True)
         
         insights = comparison_data.get("insights", [])
-        for idx, insight in enumerate(insights, start=2):
-            insights_ws[f'A{idx}'] = insight
-        
-        # Add recommendation
         recommendation = comparison_data.get("recommendation", "Недостаточно данных")
-        insights_ws['A10'] = "Рекомендация:"
-        insights_ws['A10'].font = Font(bold=True)
-        insights_ws['A11'] = recommendation
-        
-        # Auto-adjust column widths
-        for ws in wb.sheetnames:
-            worksheet = wb[ws]
-            for col_idx, column in enumerate(worksheet.columns, start=1):
-                max_length = 0
-                column_letter = get_column_letter(col_idx)
-                for cell in column:
-                    if isinstance(cell, MergedCell):
-                        continue
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                worksheet.column_dimensions[column_letter].width = min(max_length + 2, 50)
-        
-        # Save to BytesIO
-        output = BytesIO()
-        wb.save(output)
-        output.seek(0)
-        return output
+        
+        # Recommendation goes to row 10, or right below a long insights list
+        padding = max(0, 8 - len(insights))
+        insight_rows = (
+            [["Ключевые выводы"]]
+            + [[insight] for insight in insights]
+            + [[]] * padding
+            + [["Рекомендация:"], [recommendation]]
+        )
+        
+        self._set_column_widths(insights_ws, insight_rows)
+        
+        insights_ws.append([self._styled_cell(insights_ws, "Ключевые выводы", font=SECTION_FONT)])
+        for row in insight_rows[1:-2]:
+            insights_ws.append(row)
+        insights_ws.append([self._styled_cell(insights_ws, "Рекомендация:", font=LABEL_FONT)])
+        insights_ws.append([recommendation])
+        
+        return self._save_to_bytes(wb)
     
     def generate_xlsx_trends(self, trends_data: Dict[str, Any]) -> BytesIO:
         """Generate XLSX file with trends analysis"""
         
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Тренды"
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Тренды")
         
         # Add title
-        ws['A1'] = "Анализ трендов"
-        ws['A1'].font = Font(size=14, bold=True)
-        ws.merge_cells('A1:D1')
+        ws.append([self._styled_cell(ws, "Анализ трендов", font=TITLE_FONT)])
+        ws.merged_cells.add('A1:D1')
         
         # Add timeline table if available
         timeline = trends_data.get("timeline", [])
         if timeline:
-            ws['A3'] = "Дата"
-            ws['B3'] = "Значение"
-            ws['C3'] = "Причина"
+            ws.append([])
+            ws.append(["Дата", "Значение", "Причина"])
             
-            for idx, item in enumerate(timeline, start=4):
-                ws[f'A{idx}'] = item.get("date", "Н/Д")
-                ws[f'B{idx}'] = item.get("value", "Н/Д")
-                ws[f'C{idx}'] = item.get("reason", "Н/Д")
+            for item in timeline:
+                ws.append([
+                    item.get("date", "Н/Д"),
+                    item.get("value", "Н/Д"),
+                    item.get("reason", "Н/Д"),
+                ])
         
-        # Save to BytesIO
+        return self._save_to_bytes(wb)
+    
+    def _save_to_bytes(self, wb: Workbook) -> BytesIO:
+        """Save workbook into a rewound BytesIO with fast (level 1) deflate compression"""
         output = BytesIO()
-        wb.save(output)
+        with ZipFile(output, 'w', ZIP_DEFLATED, allowZip64=False, compresslevel=XLSX_COMPRESSLEVEL) as archive:
+            ExcelWriter(wb, archive).save()
         output.seek(0)
         return output
     
+    def _styled_cell(self, ws, value: Any, **styles) -> WriteOnlyCell:
+        """Create a write-only cell with the given style attributes"""
+        cell = WriteOnlyCell(ws, value=value)
+        for name, style in styles.items():
+            setattr(cell, name, style)
+        return cell
+    
+    def _set_column_widths(self, ws, rows: List[List[Any]]):
+        """Size columns to their longest value (write-only sheets need this before rows are appended)"""
+        widths = {}
+        for row in rows:
+            for c_idx, value in enumerate(row, start=1):
+                widths[c_idx] = max(widths.get(c_idx, 0), len(str(value)))
+        for c_idx, max_length in widths.items():
+            ws.column_dimensions[get_column_letter(c_idx)].width = min(max_length + 2, 50)
+    
     def get_filename(self, mode: str, bank: str = "", product_type: str = "") -> str:
         """Generate filename for report"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
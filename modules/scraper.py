@@ -1,9 +1,12 @@
-import json
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Any
 import glob
 
+from modules.utils import loads_json
+
 logger = logging.getLogger(__name__)
 
 BANK_CODE_MAP = {
@@ -23,6 +26,11 @@ PRODUCT_MAP = {
     "consumer_loan": "consumer_loan"
 }
 
+# Process-wide cap on concurrent file reads, shared by all sessions and worker threads
+# (at least 1: a zero-slot semaphore would block every read forever)
+SCRAPER_CONCURRENCY = max(1, int(os.getenv("SCRAPER_CONCURRENCY", "8")))
+_READ_SLOTS = threading.BoundedSemaphore(SCRAPER_CONCURRENCY)
+
 class BankDataReader:
     """Read product data from local JSON files"""
 
@@ -39,8 +47,8 @@ class BankDataReader:
             if matches:
                 file_path = matches[0]
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    with _READ_SLOTS, open(file_path, 'rb') as f:
+                        return loads_json(f.read())
                 except Exception as e:
                     logger.error(f"Error reading data file {file_path}: {e}")
                     return self._get_fallback_data(bank, product_type)
@@ -3,7 +3,7 @@ modules/trends_analyzer.py - Trends mode analysis through web search
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -19,14 +19,21 @@ class TrendsAnalyzer:
         
         timeline = self._generate_mock_timeline(bank, product_type, time_period)
         
+        # Derive the stats once and share them with the summary
+        analysis = self._analyze_timeline(timeline)
+        trend_direction = self._get_trend_direction(timeline, analysis)
+        
         return {
             "bank": bank,
             "product_type": product_type,
             "period": time_period,
             "timeline": timeline,
-            "analysis": self._analyze_timeline(timeline),
-            "trend_direction": self._get_trend_direction(timeline),
-            "summary": self._generate_summary(bank, product_type, timeline)
+            "timeline_columns": self._timeline_columns(timeline),
+            "analysis": analysis,
+            "trend_direction": trend_direction,
+            "summary": self._generate_summary(
+                bank, product_type, timeline, analysis, trend_direction
+            )
         }
     
     def _generate_mock_timeline(self, bank: str, product_type: str, time_period: str) -> List[Dict]:
@@ -60,6 +67,14 @@ class TrendsAnalyzer:
         
         return timeline
     
+    def _timeline_columns(self, timeline: List[Dict]) -> Dict[str, List]:
+        """Columnar (dict of lists) view of the timeline for table/DataFrame consumers"""
+        
+        if not timeline:
+            return {}
+        
+        return {key: [item.get(key) for item in timeline] for key in timeline[0]}
+    
     def _analyze_timeline(self, timeline: List[Dict]) -> Dict[str, Any]:
         """Analyze timeline for patterns"""
         
@@ -80,19 +95,21 @@ class TrendsAnalyzer:
             "change_points": len([v for v in values if v != values[0]])
         }
     
-    def _get_trend_direction(self, timeline: List[Dict]) -> str:
-        """Determine overall trend direction"""
+    def _get_trend_direction(
+        self,
+        timeline: List[Dict],
+        analysis: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Determine overall trend direction (from the analysis endpoints when given)"""
         
-        if not timeline or len(timeline) < 2:
-            return "stable"
-        
-        values = [t.get("rate") for t in timeline if t.get("rate")]
+        if analysis is None:
+            analysis = self._analyze_timeline(timeline)
         
-        if len(values) < 2:
+        if "start_value" not in analysis:
             return "stable"
         
-        start = values[0]
-        end = values[-1]
+        start = analysis["start_value"]
+        end = analysis["end_value"]
         
         if end > start * 1.02:
             return "increasing"
@@ -101,11 +118,20 @@ class TrendsAnalyzer:
         else:
             return "stable"
     
-    def _generate_summary(self, bank: str, product_type: str, timeline: List[Dict]) -> str:
-        """Generate human-readable summary"""
-        
-        trend = self._get_trend_direction(timeline)
-        analysis = self._analyze_timeline(timeline)
+    def _generate_summary(
+        self,
+        bank: str,
+        product_type: str,
+        timeline: List[Dict],
+        analysis: Optional[Dict[str, Any]] = None,
+        trend: Optional[str] = None
+    ) -> str:
+        """Generate human-readable summary (reuses precomputed analysis/trend when given)"""
+        
+        if analysis is None:
+            analysis = self._analyze_timeline(timeline)
+        if trend is None:
+            trend = self._get_trend_direction(timeline, analysis)
         
         if analysis.get("status") == "no_data":
             return f"Недостаточно данных для анализа {product_type} {bank}"
@@ -4,17 +4,40 @@ modules/utils.py - Utility functions for data processing
 
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_NUMBER_RE = re.compile(r'[\d,\.]+')
+
+def loads_json(raw: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dumps_json(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles those
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
 def load_json_config(filepath: str) -> Dict[str, Any]:
     """Load JSON configuration file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(filepath, 'rb') as f:
+            return loads_json(f.read())
     except FileNotFoundError:
         logger.error(f"Config file not found: {filepath}")
         return {}
@@ -24,10 +47,12 @@ def load_json_config(filepath: str) -> Dict[str, Any]:
 
 def save_json_cache(data: Dict[str, Any], filename: str, cache_dir: str = "./cache"):
     """Save data to JSON cache file"""
-    Path(cache_dir).mkdir(exist_ok=True)
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
     filepath = Path(cache_dir) / filename
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Serialize first so a failure never leaves a truncated cache file behind
+    payload = dumps_json(data)
+    with open(filepath, 'wb') as f:
+        f.write(payload)
     logger.info(f"Cache saved: {filepath}")
 
 def normalize_rate(rate_str: str) -> Optional[float]:
@@ -48,8 +73,7 @@ def normalize_currency(value: str, currency: str = "RUB") -> Dict[str, Any]:
 
 def extract_number(text: str) -> Optional[float]:
     """Extract first number from text"""
-    import re
-    match = re.search(r'[\d,\.]+', str(text))
+    match = _NUMBER_RE.search(str(text))
     if match:
         return float(match.group().replace(',', '.'))
     return None